@@ -188,6 +188,9 @@ def reconstruct_full_distribution(
     return reconstructed_probability
 
 
+_metadata_cache: dict[int, tuple[dict[str, Any], tuple[Any, Any, Any]]] = {}
+
+
 def _generate_metadata(
     cuts: dict[str, Any]
 ) -> tuple[
@@ -198,6 +201,11 @@ def _generate_metadata(
     """
     Generate metadata used to execute subcircuits and reconstruct probabilities of original circuit.
 
+    The metadata is deterministic in the cuts, and both the evaluation and
+    reconstruction steps need it, so the result is memoized on the identity
+    of the cuts dictionary to avoid enumerating the 4^(num cuts) summation
+    terms twice per workflow.
+
     Args:
         - cuts (dict[str, Any]): results from the cutting step
     Returns:
@@ -205,6 +213,9 @@ def _generate_metadata(
             probabilities, a dictionary with information on each of the subcircuits, and a dictionary
             containing indexes for each of the subcircuits
     """
+    cached = _metadata_cache.get(id(cuts))
+    if cached is not None and cached[0] is cuts:
+        return cached[1]
     (
         summation_terms,
         subcircuit_entries,
@@ -214,7 +225,10 @@ def _generate_metadata(
         complete_path_map=cuts["complete_path_map"],
         num_cuts=cuts["num_cuts"],
     )
-    return summation_terms, subcircuit_entries, subcircuit_instances
+    metadata = (summation_terms, subcircuit_entries, subcircuit_instances)
+    # The cached cuts reference also keeps its id from being reused
+    _metadata_cache[id(cuts)] = (cuts, metadata)
+    return metadata
 
 
 def _run_subcircuits(
@@ -274,35 +288,37 @@ def _attribute_shots(
     """
     subcircuit_entry_probs: dict[int, dict[int, np.ndarray]] = {}
     for subcircuit_idx in subcircuit_entries:
-        subcircuit_entry_probs[subcircuit_idx] = {}
-        for label in subcircuit_entries[subcircuit_idx]:
-            subcircuit_entry_idx, kronecker_term = subcircuit_entries[subcircuit_idx][
-                label
+        entries = subcircuit_entries[subcircuit_idx]
+        instance_probs = subcircuit_instance_probs[subcircuit_idx]
+        if len(entries) == 0 or len(instance_probs) == 0:
+            raise ValueError("Something unexpected happened during shot attribution.")
+
+        # All instances of a subcircuit share a measurement pattern, so their
+        # vectors stack into one matrix and every entry's weighted sum becomes
+        # a row of a single coefficient-matrix product
+        instance_matrix = np.stack(
+            [
+                instance_probs[instance_idx]
+                for instance_idx in range(len(instance_probs))
             ]
-            subcircuit_entry_prob: np.ndarray | None = None
-            for coefficient, subcircuit_instance_idx in kronecker_term:
-                if subcircuit_entry_prob is None:
-                    subcircuit_entry_prob = (
-                        coefficient
-                        * subcircuit_instance_probs[subcircuit_idx][
-                            subcircuit_instance_idx
-                        ]
-                    )
-                else:
-                    subcircuit_entry_prob += (
-                        coefficient
-                        * subcircuit_instance_probs[subcircuit_idx][
-                            subcircuit_instance_idx
-                        ]
-                    )
-
-            if subcircuit_entry_prob is None:
+        )
+        coefficient_matrix = np.zeros((len(entries), len(instance_probs)))
+        entry_indices = []
+        for row, label in enumerate(entries):
+            subcircuit_entry_idx, kronecker_term = entries[label]
+            if len(kronecker_term) == 0:
                 raise ValueError(
                     "Something unexpected happened during shot attribution."
                 )
-            subcircuit_entry_probs[subcircuit_idx][
-                subcircuit_entry_idx
-            ] = subcircuit_entry_prob
+            entry_indices.append(subcircuit_entry_idx)
+            for coefficient, subcircuit_instance_idx in kronecker_term:
+                coefficient_matrix[row, subcircuit_instance_idx] += coefficient
+        entry_matrix = coefficient_matrix @ instance_matrix
+
+        subcircuit_entry_probs[subcircuit_idx] = {
+            subcircuit_entry_idx: entry_matrix[row]
+            for row, subcircuit_entry_idx in enumerate(entry_indices)
+        }
 
     return subcircuit_entry_probs
 
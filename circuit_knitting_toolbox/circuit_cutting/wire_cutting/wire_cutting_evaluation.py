@@ -15,13 +15,16 @@ from __future__ import annotations
 
 import itertools
 import copy
+from functools import lru_cache
 from typing import Sequence, Any
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing.pool import ThreadPool
 
 import numpy as np
 
 from qiskit import QuantumCircuit
 from qiskit.converters import circuit_to_dag, dag_to_circuit
+from qiskit.dagcircuit import DAGCircuit
 from qiskit.circuit.library.standard_gates import HGate, SGate, SdgGate, XGate
 from qiskit.primitives import BaseSampler, Sampler as TestSampler
 from qiskit_ibm_runtime import QiskitRuntimeService, Sampler, Session, Options
@@ -127,6 +130,10 @@ def mutate_measurement_basis(meas: tuple[str, ...]) -> list[tuple[Any, ...]]:
         return mutated_meas_out
 
 
+# Base DAGs already converted in this process, keyed by subcircuit identity
+_subcircuit_dag_cache: dict[int, tuple[QuantumCircuit, DAGCircuit]] = {}
+
+
 def modify_subcircuit_instance(
     subcircuit: QuantumCircuit, init: tuple[str, ...], meas: tuple[str, ...]
 ) -> QuantumCircuit:
@@ -145,8 +152,14 @@ def modify_subcircuit_instance(
     Raises:
         - Exeption: if one of the init's or meas's are not an acceptable string
     """
-    subcircuit_dag = circuit_to_dag(subcircuit)
-    subcircuit_instance_dag = copy.deepcopy(subcircuit_dag)
+    # Every instance of a subcircuit starts from the same DAG, so convert it
+    # once and only pay for the copy per instance. The cached circuit
+    # reference also keeps its id from being reused.
+    cached = _subcircuit_dag_cache.get(id(subcircuit))
+    if cached is None or cached[0] is not subcircuit:
+        cached = (subcircuit, circuit_to_dag(subcircuit))
+        _subcircuit_dag_cache[id(subcircuit)] = cached
+    subcircuit_instance_dag = copy.deepcopy(cached[1])
     for i, x in enumerate(init):
         q = subcircuit.qubits[i]
         if x == "zero":
@@ -232,8 +245,13 @@ def run_subcircuits_using_sampler(
         probabilities = qd.nearest_probability_distribution()
         probabilities_out = np.zeros(2 ** subcircuits[i].num_qubits, dtype=float)
 
-        for state in probabilities:
-            probabilities_out[state] = probabilities[state]
+        # Decode all sampled states in one pass rather than per dict entry
+        states = np.fromiter(
+            probabilities.keys(), dtype=np.int64, count=len(probabilities)
+        )
+        probabilities_out[states] = np.fromiter(
+            probabilities.values(), dtype=np.float64, count=len(probabilities)
+        )
         all_probabilities_out.append(probabilities_out)
 
     return all_probabilities_out
@@ -266,6 +284,84 @@ def run_subcircuits(
     return run_subcircuits_using_sampler(subcircuits, sampler)
 
 
+@lru_cache(maxsize=None)
+def _measurement_masks(meas: tuple[Any, ...]) -> tuple[int, np.ndarray]:
+    """
+    Pack a measurement basis into bit-level masks.
+
+    Bit k of a full state is the outcome of the qubit measured in basis
+    meas[k], so the bases can be packed once into a sign-carrying bit mask
+    and the positions measured in the computational basis. The positions are
+    stored as one contiguous array so the bit gather over all states is a
+    single broadcasted shift. The packed form is cached since the same few
+    bases recur for every subcircuit instance.
+
+    Args:
+        - meas (tuple): the measurement bases
+
+    Returns:
+        - (tuple): the mask of the bits that contribute a -1 sign and the
+            positions of the computational-basis bits
+    """
+    sigma_mask = 0
+    comp_positions = []
+    for qubit_idx, meas_basis in enumerate(meas):
+        if meas_basis == "comp":
+            comp_positions.append(qubit_idx)
+        elif meas_basis != "I":
+            sigma_mask |= 1 << qubit_idx
+    return sigma_mask, np.asarray(comp_positions, dtype=np.int64)
+
+
+@lru_cache(maxsize=None)
+def _measurement_index_arrays(
+    num_states: int, meas: tuple[Any, ...]
+) -> tuple[np.ndarray | None, np.ndarray, int]:
+    """
+    Build the per-state decode arrays for a measurement basis.
+
+    The odd-parity mask and the effective-state gather depend only on the
+    number of states and the basis, while a batch decodes many instances
+    against the same few bases, so the arrays are deduplicated with a cache
+    instead of being rebuilt per instance.
+
+    Args:
+        - num_states (int): the length of the unmeasured distribution
+        - meas (tuple): the measurement bases
+
+    Returns:
+        - (tuple): the mask of the states with odd sign parity (None when no
+            basis contributes a sign), the effective state index of every full
+            state, and the number of effective states
+    """
+    sigma_mask, comp_positions = _measurement_masks(meas)
+    # Request int64 explicitly: the parity fold shifts by up to 32 bits, which
+    # would overrun the default platform integer where it is 32 bits wide
+    full_states = np.arange(num_states, dtype=np.int64)
+
+    if sigma_mask == 0:
+        # Identity and computational bases contribute no signs
+        odd_parities = None
+    else:
+        # The parity of the masked bits gives the +-1 sigma of every full
+        # state; a byte-wide parity mask moves far fewer bytes than a
+        # full-width sigma vector
+        parities = full_states & sigma_mask
+        for shift in (32, 16, 8, 4, 2, 1):
+            parities ^= parities >> shift
+        odd_parities = (parities & 1).astype(np.bool_)
+
+    # Gather the computational-basis bits into the effective state indices
+    # with one broadcasted shift over the contiguous position array
+    significances = np.arange(len(comp_positions))
+    effective_states = np.bitwise_or.reduce(
+        ((full_states[:, None] >> comp_positions) & 1) << significances,
+        axis=1,
+    )
+
+    return odd_parities, effective_states, int(2 ** len(comp_positions))
+
+
 def measure_prob(unmeasured_prob: np.ndarray, meas: tuple[Any, ...]) -> np.ndarray:
     """
     Compute the effective probability distribution from the subcircuit distribution.
@@ -280,11 +376,24 @@ def measure_prob(unmeasured_prob: np.ndarray, meas: tuple[Any, ...]) -> np.ndarr
     if meas.count("comp") == len(meas):
         return np.array(unmeasured_prob)
     else:
-        measured_prob = np.zeros(int(2 ** meas.count("comp")))
-        for full_state, p in enumerate(unmeasured_prob):
-            sigma, effective_state = measure_state(full_state=full_state, meas=meas)
-            # TODO: Add states merging here. Change effective_state to merged_bin
-            measured_prob[effective_state] += sigma * p
+        unmeasured_prob = np.asarray(unmeasured_prob)
+        (
+            odd_parities,
+            effective_states,
+            num_effective_states,
+        ) = _measurement_index_arrays(len(unmeasured_prob), tuple(meas))
+
+        if odd_parities is None:
+            signed_prob = unmeasured_prob.astype(np.float64, copy=False)
+        else:
+            signed_prob = unmeasured_prob.astype(np.float64, copy=True)
+            np.negative(signed_prob, where=odd_parities, out=signed_prob)
+
+        measured_prob = np.bincount(
+            effective_states,
+            weights=signed_prob,
+            minlength=num_effective_states,
+        )
 
         return measured_prob
 
@@ -303,15 +412,11 @@ def measure_state(full_state: int, meas: tuple[Any, ...]) -> tuple[int, int]:
         - (tuple): sigma (defined by the parity of non computational basis 1 measurements) and
             the effective state (defined by the measurements in the computational basis)
     """
-    bin_full_state = bin(full_state)[2:].zfill(len(meas))
-    sigma = 1
-    bin_effective_state = ""
-    for meas_bit, meas_basis in zip(bin_full_state, meas[::-1]):
-        if meas_bit == "1" and meas_basis != "I" and meas_basis != "comp":
-            sigma *= -1
-        if meas_basis == "comp":
-            bin_effective_state += meas_bit
-    effective_state = int(bin_effective_state, 2) if bin_effective_state != "" else 0
+    sigma_mask, comp_positions = _measurement_masks(tuple(meas))
+    sigma = 1 - 2 * (bin(full_state & sigma_mask).count("1") & 1)
+    effective_state = 0
+    for significance, qubit_idx in enumerate(comp_positions):
+        effective_state |= ((full_state >> qubit_idx) & 1) << significance
 
     return sigma, effective_state
 
@@ -340,6 +445,7 @@ def _run_subcircuit_batch(
     """
     subcircuit_instance_probs = {}
     circuits_to_run = []
+    circuit_measurements = []
 
     # For each circuit associated with a given subcircuit
     for init_meas in subcircuit_instance:
@@ -354,6 +460,7 @@ def _run_subcircuit_batch(
             )
             circuits_to_run.append(modified_subcircuit_instance)
             mutated_meas = mutate_measurement_basis(meas=tuple(init_meas[1]))
+            circuit_measurements.append((init_meas[0], mutated_meas))
             for meas in mutated_meas:
                 mutated_subcircuit_instance_idx = subcircuit_instance[
                     (init_meas[0], meas)
@@ -363,33 +470,32 @@ def _run_subcircuit_batch(
                     [0.0]
                 )
 
-    # Run all of our circuits in one batch
-    subcircuit_inst_probs = run_subcircuits(
-        circuits_to_run,
-        service=service,
-        backend_name=backend_name,
-        options=options,
-    )
+    # Run all of our circuits in one batch, and warm the decode caches for
+    # every measurement basis while the circuits execute remotely
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        batch_future = executor.submit(
+            run_subcircuits,
+            circuits_to_run,
+            service=service,
+            backend_name=backend_name,
+            options=options,
+        )
+        num_states = 2**subcircuit.num_qubits
+        for _, mutated_meas in circuit_measurements:
+            for meas in mutated_meas:
+                if meas.count("comp") != len(meas):
+                    _measurement_index_arrays(num_states, tuple(meas))
+        subcircuit_inst_probs = batch_future.result()
 
     # Calculate the measured probabilities
-    unique_subcircuit_check = {}
-    i = 0
-    for init_meas in subcircuit_instance:
-        subcircuit_instance_idx = subcircuit_instance[init_meas]
-        if subcircuit_instance_idx not in unique_subcircuit_check:
-            subcircuit_inst_prob = subcircuit_inst_probs[i]
-            i = i + 1
-            mutated_meas = mutate_measurement_basis(meas=tuple(init_meas[1]))
-            for meas in mutated_meas:
-                measured_prob = measure_prob(
-                    unmeasured_prob=subcircuit_inst_prob, meas=meas
-                )
-                mutated_subcircuit_instance_idx = subcircuit_instance[
-                    (init_meas[0], meas)
-                ]
-                subcircuit_instance_probs[
-                    mutated_subcircuit_instance_idx
-                ] = measured_prob
-                unique_subcircuit_check[mutated_subcircuit_instance_idx] = True
+    for subcircuit_inst_prob, (init, mutated_meas) in zip(
+        subcircuit_inst_probs, circuit_measurements
+    ):
+        for meas in mutated_meas:
+            measured_prob = measure_prob(
+                unmeasured_prob=subcircuit_inst_prob, meas=meas
+            )
+            mutated_subcircuit_instance_idx = subcircuit_instance[(init, meas)]
+            subcircuit_instance_probs[mutated_subcircuit_instance_idx] = measured_prob
 
     return subcircuit_instance_probs
@@ -269,13 +269,29 @@ def generate_summation_terms(
         int, dict[tuple[tuple[str, ...], tuple[Any, ...]], int]
     ] = {subcircuit_idx: {} for subcircuit_idx in range(len(subcircuits))}
     O_rho_pairs = get_cut_qubit_pairs(complete_path_map=complete_path_map)
+    # Validate the pairs and pull out each cut's destination subcircuits once,
+    # rather than re-deriving them from the pair dicts for every summation term
+    for pair in O_rho_pairs:
+        if len(pair) != 2:
+            raise ValueError(
+                f"O_rho_pairs should only contain sequences of length 2: {pair}"
+            )
+    pair_subcircuit_indices = [
+        (pair[0]["subcircuit_idx"], pair[-1]["subcircuit_idx"]) for pair in O_rho_pairs
+    ]
     for summation_term_idx in range(4**num_cuts):
         label = get_label(label_idx=summation_term_idx, num_cuts=num_cuts)
         # print('%d/%d summation term:'%(summation_term_idx+1,4**num_cuts),label)
         summation_term = {}
-        subcircuit_labels = attribute_label(
-            label=label, O_rho_pairs=O_rho_pairs, num_subcircuits=len(subcircuits)
-        )
+        subcircuit_labels: dict[int, dict[str, str]] = {
+            subcircuit_idx: {"init": "", "meas": ""}
+            for subcircuit_idx in range(len(subcircuits))
+        }
+        for c, (O_subcircuit_idx, rho_subcircuit_idx) in zip(
+            label, pair_subcircuit_indices
+        ):
+            subcircuit_labels[O_subcircuit_idx]["meas"] += c
+            subcircuit_labels[rho_subcircuit_idx]["init"] += c
         for subcircuit_idx in range(len(subcircuits)):
             # print('subcircuit %d label :'%subcircuit_idx,subcircuit_labels[subcircuit_idx])
             subcircuit_entry_key = (
@@ -362,10 +378,32 @@ def naive_compute(
     """
     reconstructed_prob = None
     overhead = {"additions": 0, "multiplications": 0}
+
+    # Kronecker products distribute over addition, so terms sharing every
+    # entry except the last subcircuit's can sum their final factors first
+    # and share a single Kronecker chain. The last subcircuit has the longest
+    # vectors, making those sums much cheaper than the products they replace.
+    leading_order = subcircuit_order[:-1]
+    last_subcircuit_idx = subcircuit_order[-1]
+    grouped_last_probs: dict[tuple[int, ...], np.ndarray] = {}
     for summation_term in summation_terms:
+        leading_entries = tuple(
+            summation_term[subcircuit_idx] for subcircuit_idx in leading_order
+        )
+        last_prob = subcircuit_entry_probs[last_subcircuit_idx][
+            summation_term[last_subcircuit_idx]
+        ]
+        if leading_entries in grouped_last_probs:
+            grouped_last_probs[leading_entries] = (
+                grouped_last_probs[leading_entries] + last_prob
+            )
+            overhead["additions"] += len(last_prob)
+        else:
+            grouped_last_probs[leading_entries] = last_prob
+
+    for leading_entries, summed_last_prob in grouped_last_probs.items():
         summation_term_prob = None
-        for subcircuit_idx in subcircuit_order:
-            subcircuit_entry_idx = summation_term[subcircuit_idx]
+        for subcircuit_idx, subcircuit_entry_idx in zip(leading_order, leading_entries):
             subcircuit_entry_prob = subcircuit_entry_probs[subcircuit_idx][
                 subcircuit_entry_idx
             ]
@@ -376,6 +414,11 @@ def naive_compute(
                     summation_term_prob, subcircuit_entry_prob
                 )
                 overhead["multiplications"] += len(summation_term_prob)
+        if summation_term_prob is None:
+            summation_term_prob = summed_last_prob
+        else:
+            summation_term_prob = np.kron(summation_term_prob, summed_last_prob)
+            overhead["multiplications"] += len(summation_term_prob)
         if reconstructed_prob is None:
             reconstructed_prob = summation_term_prob
         else:
@@ -125,18 +125,30 @@ def generate_reconstructed_output(
     for subcircuit_idx in smart_order:
         unordered_qubit += subcircuit_out_qubits[subcircuit_idx]
 
-    reconstructed_output = np.zeros(len(unordered))
+    num_qubits = full_circuit.num_qubits
+
+    # The reordering depends only on the qubit order, so compute the character
+    # permutation once instead of re-sorting for every state
+    permutation = sorted(
+        range(num_qubits),
+        key=lambda char_idx: unordered_qubit[char_idx],
+        reverse=True,
+    )
 
-    for unordered_state, unordered_p in enumerate(unordered):
-        bin_unordered_state = bin(unordered_state)[2:].zfill(full_circuit.num_qubits)
-        _, ordered_bin_state = zip(
-            *sorted(zip(unordered_qubit, bin_unordered_state), reverse=True)
-        )
-        ordered_bin_state_str = "".join([str(x) for x in ordered_bin_state])
-        ordered_state = int(ordered_bin_state_str, 2)
-        reconstructed_output[ordered_state] = unordered_p
+    # Character j of the ordered binary string reads bit (n-1-permutation[j])
+    # of the unordered state and lands at bit (n-1-j) of the ordered state,
+    # so the string round-trip folds into precomputed shifts over all states
+    unordered_states = np.arange(len(unordered))
+    ordered_states = np.zeros_like(unordered_states)
+    for char_idx, source_char_idx in enumerate(permutation):
+        source_bit = num_qubits - 1 - source_char_idx
+        target_bit = num_qubits - 1 - char_idx
+        ordered_states |= ((unordered_states >> source_bit) & 1) << target_bit
+
+    reconstructed_output = np.zeros(len(unordered))
+    reconstructed_output[ordered_states] = unordered
 
-    return np.array(reconstructed_output)
+    return reconstructed_output
 
 
 def _evaluate_circuit(circuit: QuantumCircuit) -> Sequence[float]:
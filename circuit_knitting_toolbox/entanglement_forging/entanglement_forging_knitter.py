@@ -14,14 +14,19 @@
 from __future__ import annotations
 
 import time
+import random
 import logging
+from functools import lru_cache
 from typing import Sequence, Any
 from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
+from scipy.linalg import eigh
 
 from qiskit import QuantumCircuit
-from qiskit.quantum_info import Pauli
+from qiskit.circuit import CircuitInstruction
+from qiskit.circuit.library.standard_gates import XGate
+from qiskit.quantum_info import Pauli, SparsePauliOp
 from qiskit.primitives import Estimator as TestEstimator
 from qiskit_ibm_runtime import QiskitRuntimeService, Session, Options, Estimator
 
@@ -30,6 +35,35 @@ from .entanglement_forging_operator import EntanglementForgingOperator
 
 logger = logging.getLogger(__name__)
 
+# Shared, parameterless gate instance used when preparing bitstring circuits
+_X_GATE = XGate()
+
+# Services already constructed in this process, keyed by account settings
+_SERVICE_CACHE: dict[tuple[tuple[str, str], ...], QiskitRuntimeService] = {}
+
+
+def _get_runtime_service(service_args: dict[str, Any]) -> QiskitRuntimeService:
+    """Construct a QiskitRuntimeService, reusing one whenever possible.
+
+    Building a service performs an authentication handshake, so services are
+    cached per account in this process instead of being re-instantiated for
+    every partition of every knitter call.
+
+    Args:
+        - service_args (dict[str, Any]): the account settings for the service
+
+    Returns:
+        - (QiskitRuntimeService): the service for the given account
+    """
+    cache_key = tuple(
+        sorted((name, repr(value)) for name, value in service_args.items())
+    )
+    service = _SERVICE_CACHE.get(cache_key)
+    if service is None:
+        service = QiskitRuntimeService(**service_args)
+        _SERVICE_CACHE[cache_key] = service
+    return service
+
 
 class EntanglementForgingKnitter:
     """Container for Knitter class functions and attributes.
@@ -116,6 +150,39 @@ class EntanglementForgingKnitter:
                 self._ansatz.bitstrings_v  # type: ignore
             )
 
+        # Compose the parameterized ansatz onto each stateprep circuit once.
+        # Only the parameter values change between calls to this object, so
+        # __call__ can bind new values instead of recomposing every circuit.
+        # The u and v circuits share one list (ordered u then v, with the v
+        # entries omitted in the symmetric case) so that __call__ binds each
+        # batch in a single pass.
+        tensor_prep_circuits = list(self._tensor_circuits_u)
+        superposition_prep_circuits = list(self._superposition_circuits_u)
+        if not self._ansatz.bitstrings_are_symmetric:
+            tensor_prep_circuits += self._tensor_circuits_v
+            superposition_prep_circuits += self._superposition_circuits_v
+        self._tensor_ansatze = [
+            prep_circ.compose(self._ansatz.circuit_u)
+            for prep_circ in tensor_prep_circuits
+        ]
+        self._superposition_ansatze = [
+            prep_circ.compose(self._ansatz.circuit_u)
+            for prep_circ in superposition_prep_circuits
+        ]
+        # Scale factors accounting for the 1/sqrt(2) stateprep coefficients,
+        # resolved from the circuit names once so the estimator can apply
+        # them as a single broadcast multiply
+        self._superposition_scales = np.array(
+            [
+                0.0
+                if "hybrid_xmin" in circuit.name
+                else 1.0
+                if "hybrid_xplus" in circuit.name
+                else 0.5
+                for circuit in self._superposition_ansatze
+            ]
+        )
+
     @property
     def ansatz(self) -> EntanglementForgingAnsatz:
         """
@@ -188,7 +255,7 @@ class EntanglementForgingKnitter:
         Returns:
             - (QiskitRuntimeService): the service member variable
         """
-        return QiskitRuntimeService(**self._service)
+        return _get_runtime_service(self._service)
 
     @service.setter
     def service(self, service: QiskitRuntimeService | None) -> None:
@@ -245,43 +312,31 @@ class EntanglementForgingKnitter:
                     raise AttributeError(
                         f"The list of backend names is length ({len(self._backend_names)}), but the list of options is length ({len(self._options)}). It is ambiguous how to combine the options with the backends."
                     )
-        # For now, we only assign the parameters to a copy of the ansatz
-        circuit_u = self._ansatz.circuit_u.bind_parameters(ansatz_parameters)
-
-        # Create the tensor and superposition stateprep circuits
+        # Bind the parameter values to copies of the precomposed ansatze
         # tensor_ansatze   = [U|bi⟩      for |bi⟩       in  tensor_circuits]
         # superposition_ansatze = [U|𝜙^𝑝_𝑏𝑛𝑏𝑚⟩ for |𝜙^𝑝_𝑏𝑛𝑏𝑚⟩ in superposition_circuits]
-        tensor_ansatze_u = [
-            prep_circ.compose(circuit_u) for prep_circ in self._tensor_circuits_u
+        tensor_ansatze = [
+            circuit.assign_parameters(ansatz_parameters)
+            for circuit in self._tensor_ansatze
         ]
-        superposition_ansatze_u = [
-            prep_circ.compose(circuit_u) for prep_circ in self._superposition_circuits_u
+        superposition_ansatze = [
+            circuit.assign_parameters(ansatz_parameters)
+            for circuit in self._superposition_ansatze
         ]
 
-        tensor_ansatze_v = []
-        superposition_ansatze_v = []
-        if not self._ansatz.bitstrings_are_symmetric:
-            tensor_ansatze_v = [
-                prep_circ.compose(circuit_u) for prep_circ in self._tensor_circuits_v
-            ]
-            superposition_ansatze_v = [
-                prep_circ.compose(circuit_u)
-                for prep_circ in self._superposition_circuits_v
-            ]
-
         # Partition the expectation values for parallel calculation
         if self._backend_names:
             num_partitions = len(self._backend_names)
         else:
             num_partitions = 1
 
-        tensor_ansatze = tensor_ansatze_u + tensor_ansatze_v
-        superposition_ansatze = superposition_ansatze_u + superposition_ansatze_v
-
         partitioned_tensor_ansatze = _partition(tensor_ansatze, num_partitions)
         partitioned_superposition_ansatze = _partition(
             superposition_ansatze, num_partitions
         )
+        partitioned_superposition_scales = _partition(
+            self._superposition_scales, num_partitions
+        )
 
         # Get the RuntimeService as a hashable dictionary
         service_args = None
@@ -294,46 +349,70 @@ class EntanglementForgingKnitter:
         else:
             session_ids = self._session_ids
 
-        partitioned_expval_futures = []
-        with ThreadPoolExecutor() as executor:
-            for partition_index, (
-                tensor_ansatze_partition,
-                superposition_ansatze_partition,
-            ) in enumerate(
-                zip(partitioned_tensor_ansatze, partitioned_superposition_ansatze)
-            ):
-                backend_name = (
-                    None
-                    if self._backend_names is None
-                    else self._backend_names[partition_index]
-                )
-                options = (
-                    None if self._options is None else self._options[partition_index]
+        tensor_pauli_list = list(forged_operator.tensor_paulis)
+        superposition_pauli_list = list(forged_operator.superposition_paulis)
+
+        if num_partitions == 1:
+            # With a single partition there is nothing to run in parallel, so
+            # evaluate inline rather than round-tripping through an executor
+            partitioned_expval_results = [
+                _estimate_expvals(
+                    tensor_ansatze,
+                    tensor_pauli_list,
+                    superposition_ansatze,
+                    superposition_pauli_list,
+                    self._superposition_scales,
+                    service_args,
+                    None if self._backend_names is None else self._backend_names[0],
+                    None if self._options is None else self._options[0],
+                    session_ids[0],
                 )
-                tensor_pauli_list = list(forged_operator.tensor_paulis)
-                superposition_pauli_list = list(forged_operator.superposition_paulis)
-                partitioned_expval_futures.append(
-                    executor.submit(
-                        _estimate_expvals,
-                        tensor_ansatze_partition,
-                        tensor_pauli_list,
-                        superposition_ansatze_partition,
-                        superposition_pauli_list,
-                        service_args,
-                        backend_name,
-                        options,
-                        session_ids[partition_index],
+            ]
+        else:
+            partitioned_expval_futures = []
+            with ThreadPoolExecutor() as executor:
+                for partition_index, (
+                    tensor_ansatze_partition,
+                    superposition_ansatze_partition,
+                ) in enumerate(
+                    zip(partitioned_tensor_ansatze, partitioned_superposition_ansatze)
+                ):
+                    backend_name = (
+                        None
+                        if self._backend_names is None
+                        else self._backend_names[partition_index]
                     )
-                )
+                    options = (
+                        None
+                        if self._options is None
+                        else self._options[partition_index]
+                    )
+                    partitioned_expval_futures.append(
+                        executor.submit(
+                            _estimate_expvals,
+                            tensor_ansatze_partition,
+                            tensor_pauli_list,
+                            superposition_ansatze_partition,
+                            superposition_pauli_list,
+                            partitioned_superposition_scales[partition_index],
+                            service_args,
+                            backend_name,
+                            options,
+                            session_ids[partition_index],
+                        )
+                    )
+            partitioned_expval_results = [
+                future.result() for future in partitioned_expval_futures
+            ]
 
         tensor_expvals = []
         superposition_expvals = []
-        for i, partitioned_expval_future in enumerate(partitioned_expval_futures):
+        for i, partitioned_expval_result in enumerate(partitioned_expval_results):
             (
                 partition_tensor_expvals,
                 partition_superposition_expvals,
                 job_id,
-            ) = partitioned_expval_future.result()
+            ) = partitioned_expval_result
             tensor_expvals.extend(partition_tensor_expvals)
             superposition_expvals.extend(partition_superposition_expvals)
             # Start a session for each thread if this is the first run
@@ -348,7 +427,9 @@ class EntanglementForgingKnitter:
         h_schmidt = self._compute_h_schmidt(
             forged_operator, np.array(tensor_expvals), np.array(superposition_expvals)
         )
-        evals, evecs = np.linalg.eigh(h_schmidt)
+        # Only the lowest eigenpair is consumed, so ask LAPACK for just that
+        # one instead of the full spectrum
+        evals, evecs = eigh(h_schmidt, subset_by_index=[0, 0])
         schmidt_coeffs = evecs[:, 0]
         energy = evals[0]
 
@@ -378,20 +459,19 @@ class EntanglementForgingKnitter:
         # summing the expectation values associated with the tensor terms
         # h𝑛𝑛 = Σ_ab 𝑤𝑎𝑏•[ 𝜆𝑛^2•⟨b𝑛|U^t•P𝑎•U|b𝑛⟩⟨b𝑛|V^t•P𝑏•V|b𝑛⟩ ]
         if self._ansatz.bitstrings_are_symmetric:
-            h_schmidt_diagonal = np.einsum(
-                "ij, xi, xj->x",
-                forged_operator.w_ij,  # type: ignore
-                tensor_expvals,
-                tensor_expvals,
-            )
+            tensor_expvals_u = tensor_expvals
+            tensor_expvals_v = tensor_expvals
         else:
             num_tensor_terms = int(np.shape(tensor_expvals)[0] / 2)
-            h_schmidt_diagonal = np.einsum(
-                "ij, xi, xj->x",
-                forged_operator.w_ij,  # type: ignore
-                tensor_expvals[:num_tensor_terms, :],
-                tensor_expvals[num_tensor_terms:, :],
-            )
+            tensor_expvals_u = tensor_expvals[:num_tensor_terms, :]
+            tensor_expvals_v = tensor_expvals[num_tensor_terms:, :]
+        # diag(E_u @ w_ij @ E_v^T) without forming the full matrix: one BLAS
+        # matmul followed by a row-wise inner product
+        h_schmidt_diagonal = np.einsum(
+            "xj,xj->x",
+            tensor_expvals_u @ forged_operator.w_ij,  # type: ignore
+            tensor_expvals_v,
+        )
         h_schmidt = np.diag(h_schmidt_diagonal)
 
         # Including the +/-Y superpositions would increase this to 4
@@ -400,43 +480,47 @@ class EntanglementForgingKnitter:
         # superpos_ansatze[2i]   = U|𝜙^0_𝑏𝑛𝑏𝑚⟩
         # superpos_expvals[2i]   = [⟨𝜙^0_𝑏𝑛𝑏𝑚|U^t•𝑃𝑎•U|𝜙^0_𝑏𝑛𝑏𝑚⟩ for 𝑃𝑎 in superpos_paulis]
         # superpos_expvals[2i+1] = [⟨𝜙^1_𝑏𝑛𝑏𝑚|U^t•𝑃𝑎•U|𝜙^1_𝑏𝑛𝑏𝑚⟩ for 𝑃𝑎 in superpos_paulis]
-        superpos_expvals = np.array(superpos_expvals)
-
+        # The caller already hands us ndarrays; asarray avoids copying the
+        # full expectation-value table a second time
+        superpos_expvals = np.asarray(superpos_expvals)
+
+        # Group each +x/-x pair along its own axis and fold the -1^p signs
+        # directly into the contraction, so the p_plus_x - p_minus_x delta
+        # arrays never need to be materialized
+        lin_combo_signs = np.array([1.0, -1.0])
+        num_superpos_paulis = np.shape(superpos_expvals)[1]
         if self._ansatz.bitstrings_are_symmetric:
-            p_plus_x = superpos_expvals[0::num_lin_combos, :]
-            p_minus_x = superpos_expvals[1::num_lin_combos, :]
-            p_delta_x_u = p_plus_x - p_minus_x
-            p_delta_x_v = p_delta_x_u
+            paired_expvals_u = superpos_expvals.reshape(
+                (-1, num_lin_combos, num_superpos_paulis)
+            )
+            paired_expvals_v = paired_expvals_u
         else:
             num_superpos_terms = int(np.shape(superpos_expvals)[0] / 2)
-            pvss_u = superpos_expvals[:num_superpos_terms, :]
-            pvss_v = superpos_expvals[num_superpos_terms:, :]
-
-            p_plus_x_u = pvss_u[0::num_lin_combos, :]
-            p_minus_x_u = pvss_u[1::num_lin_combos, :]
-            p_delta_x_u = p_plus_x_u - p_minus_x_u
-
-            p_plus_x_v = pvss_v[0::num_lin_combos, :]
-            p_minus_x_v = pvss_v[1::num_lin_combos, :]
-            p_delta_x_v = p_plus_x_v - p_minus_x_v
+            paired_expvals_u = superpos_expvals[:num_superpos_terms, :].reshape(
+                (-1, num_lin_combos, num_superpos_paulis)
+            )
+            paired_expvals_v = superpos_expvals[num_superpos_terms:, :].reshape(
+                (-1, num_lin_combos, num_superpos_paulis)
+            )
 
         # Calculate and assign the off-diagonal values of the Schmidt matrix by
         # summing the expectation values associated with the superpos terms
         h_schmidt_off_diagonals = np.einsum(
-            "ab,xa,xb->x", forged_operator.w_ab, p_delta_x_u, p_delta_x_v  # type: ignore
+            "ab,p,q,xpa,xqb->x",
+            forged_operator.w_ab,  # type: ignore
+            lin_combo_signs,
+            lin_combo_signs,
+            paired_expvals_u,
+            paired_expvals_v,
+            optimize="greedy",
         )
-        # Create off diagonal index list
-        superpos_indices = []
-        for x in range(self._ansatz.subspace_dimension):
-            for y in range(self._ansatz.subspace_dimension):
-                if x == y:
-                    continue
-                superpos_indices += [(x, y)]
-
         # h𝑛𝑚 = Σ_ab 𝑤𝑎𝑏 •[ 𝜆𝑛𝜆𝑚•Σ_𝑝∈ℤ4 -1^𝑝•⟨𝜙^𝑝_𝑏𝑛𝑏𝑚|U^t•𝑃𝑎•U|𝜙^𝑝_𝑏𝑛𝑏𝑚⟩•
         #                                   ⟨𝜙^𝑝_𝑏𝑛𝑏𝑚|V^t•𝑃𝑏•V|𝜙^𝑝_𝑏𝑛𝑏𝑚⟩ ]
-        for element, indices in zip(h_schmidt_off_diagonals, superpos_indices):
-            h_schmidt[indices] = element
+        # The off-diagonal expectation values are ordered row-major with the
+        # diagonal skipped, so a single fancy-index write scatters them all
+        subspace_dimension = self._ansatz.subspace_dimension
+        off_diagonal_mask = ~np.eye(subspace_dimension, dtype=bool)
+        h_schmidt[off_diagonal_mask] = h_schmidt_off_diagonals
 
         return h_schmidt
 
@@ -545,13 +629,30 @@ def _construct_stateprep_circuits(
     ]
 
     superpos_prep_circuits = []
+    # Compute the pairwise difference table in one vectorized operation, and
+    # share the prepared-bitstring-plus-hadamard template between pairs that
+    # lead to the same base pattern (e.g. (n, m) and (m, n)) rather than
+    # rebuilding it gate by gate for every pair
+    diff_table = bitstring_array[:, None, :] != bitstring_array[None, :, :]
+    # Batch the remaining pair bookkeeping: which pairs differ at all is one
+    # vectorized reduction, and the differing positions themselves are shared
+    # between (n, m) and (m, n) so they are only extracted once per pair
+    pairs_differ = diff_table.any(axis=-1)
+    diffs_cache: dict[tuple[int, int], np.ndarray] = {}
+    template_cache: dict[tuple[int, bytes], QuantumCircuit] = {}
     # Create superposition circuits for each bitstring pair
     for bs1_idx, bs1 in enumerate(bitstring_array):
         for bs2_idx, bs2 in enumerate(bitstring_array):
             if bs1_idx == bs2_idx:
                 continue
-            diffs = np.where(bs1 != bs2)[0]
-            if len(diffs) > 0:
+            if pairs_differ[bs1_idx, bs2_idx]:
+                pair_key = (
+                    (bs1_idx, bs2_idx) if bs1_idx < bs2_idx else (bs2_idx, bs1_idx)
+                )
+                diffs = diffs_cache.get(pair_key)
+                if diffs is None:
+                    diffs = np.nonzero(diff_table[bs1_idx, bs2_idx])[0]
+                    diffs_cache[pair_key] = diffs
                 i = diffs[0]
                 if bs1[i]:
                     x = bs2
@@ -560,9 +661,15 @@ def _construct_stateprep_circuits(
 
                 # Find the first position the bitstrings differ and place a
                 # hadamard in that position
-                S = np.delete(diffs, 0)
-                qcirc = _prepare_bitstring(np.concatenate((x[:i], [0], x[i + 1 :])))
-                qcirc.h(i)
+                S = diffs[1:]
+                base_bitstring = x.copy()
+                base_bitstring[i] = 0
+                template_key = (int(i), base_bitstring.tobytes())
+                qcirc = template_cache.get(template_key)
+                if qcirc is None:
+                    qcirc = _prepare_bitstring(base_bitstring)
+                    qcirc.h(i)
+                    template_cache[template_key] = qcirc
 
                 # Create a superposition circuit for each psi value in {0, 2}
                 psi_xplus, psi_xmin = [
@@ -610,28 +717,50 @@ def _prepare_bitstring(
         - (QuantumCircuit): the prepared circuit
     """
     qcirc = QuantumCircuit(len(bitstring), name=name)
-    for qb_idx, bit in enumerate(bitstring):
-        if bit:
-            qcirc.x(qb_idx)
+    # Append a shared XGate instance directly to the circuit data, skipping
+    # the broadcasting and gate-construction machinery behind qcirc.x()
+    qcirc.data.extend(
+        CircuitInstruction(_X_GATE, (qcirc.qubits[qb_idx],), ())
+        for qb_idx in np.nonzero(bitstring)[0]
+    )
     return qcirc
 
 
 def _partition(a, n):
     """Partitions the input.
 
-    Function that partitions the input, a, into a generator containing
-    n sub-partitions of a (that are the same type as a).
+    Function that partitions the input, a, into a list containing
+    n sub-partitions of a (that are the same type as a). The split points
+    match numpy.array_split, which cannot be used directly here because it
+    would coerce the circuits into object arrays.
     Example:
-    _partition([1, 2, 3], 2) -> (i for i in [[1, 2], [3]])
+    _partition([1, 2, 3], 2) -> [[1, 2], [3]]
 
     Args:
         - a (iterable): an object with length and indexing to be partitioned
         - n (int): the number of partitions
     Returns:
-        - (generator): the generator containing the paritions
+        - (list): the list containing the paritions
     """
     k, m = divmod(len(a), n)
-    return (a[i * k + min(i, m) : (i + 1) * k + min(i + 1, m)] for i in range(n))
+    return [a[i * k + min(i, m) : (i + 1) * k + min(i + 1, m)] for i in range(n)]
+
+
+@lru_cache(maxsize=4)
+def _observables_from_labels(pauli_labels: tuple[str, ...]) -> list[SparsePauliOp]:
+    """Convert Pauli labels into SparsePauliOp observables.
+
+    The set of Pauli operators measured for a given forged operator is fixed
+    across VQE iterations, so the converted observables are cached on the
+    (hashable) label tuple and only built on the first call.
+
+    Args:
+        - pauli_labels (tuple[str, ...]): the labels of the pauli operators
+
+    Returns:
+        - (list[SparsePauliOp]): one observable per input label
+    """
+    return [SparsePauliOp(label) for label in pauli_labels]
 
 
 def _estimate_expvals(
@@ -639,6 +768,7 @@ def _estimate_expvals(
     tensor_paulis: list[Pauli],
     superposition_ansatze: list[QuantumCircuit],
     superposition_paulis: list[Pauli],
+    superposition_scales: np.ndarray,
     service_args: dict[str, Any] | None = None,
     backend_name: str | None = None,
     options: Options | None = None,
@@ -648,9 +778,13 @@ def _estimate_expvals(
 
     Function to estimate the exepctation value of some observables on the
     tensor and superposition circuits used for reconstructing the full
-    expectation value from the Schmidt decomposed circuit. The ray decorator
-    indicates that this is an actor function (that runs its own python
-    process).
+    expectation value from the Schmidt decomposed circuit.
+
+    All tensor and superposition circuits for a partition are concatenated
+    and submitted as one estimator job, so a backend sees a single request
+    per partition per iteration rather than one per circuit; this relies on
+    every circuit in the partition acting on the same number of qubits,
+    which the knitter guarantees by construction.
 
     Args:
         - tensor_ansatze (list[QuantumCircuit]): the circuits that have the same
@@ -662,6 +796,8 @@ def _estimate_expvals(
         - superposition_paulis (list[Pauli]): the pauli operators to measure and calculate
             the expectation values from for the circuits with different Schmidt
             coefficients
+        - superposition_scales (np.ndarray): the scale factor for each superposition
+            circuit, accounting for the 1/sqrt(2) stateprep coefficients
         - service_args (dict[str, Any]): The service account used to spawn Qiskit primitives
         - backend_name (str): The backend to use to evaluate the grouped experiments
         - options (Options): The options to use with the backend
@@ -671,20 +807,38 @@ def _estimate_expvals(
         - (tuple[list[np.ndarray], list[np.ndarray], str | None]): the expectation values for the
             tensor circuits and superposition circuits
     """
-    ansatz_t: list[QuantumCircuit] = []
-    observables_t: list[Pauli] = []
-    for i, circuit in enumerate(tensor_ansatze):
-        ansatz_t += [circuit] * len(tensor_paulis)
-        observables_t += tensor_paulis
-
-    ansatz_s: list[QuantumCircuit] = []
-    observables_s: list[Pauli] = []
-    for i, circuit in enumerate(superposition_ansatze):
-        ansatz_s += [circuit] * len(superposition_paulis)
-        observables_s += superposition_paulis
+    # An empty partition can occur when there are more backends than
+    # circuits; return immediately rather than opening a session and
+    # submitting an empty batch
+    if not tensor_ansatze and not superposition_ansatze:
+        return [], [], None
+
+    # Convert each unique Pauli to a SparsePauliOp up front so the Estimator
+    # does not repeat the coercion for every (circuit, observable) pair below;
+    # the conversion itself is cached across VQE iterations
+    tensor_observables = _observables_from_labels(
+        tuple(pauli.to_label() for pauli in tensor_paulis)
+    )
+    superposition_observables = _observables_from_labels(
+        tuple(pauli.to_label() for pauli in superposition_paulis)
+    )
 
-    all_ansatze_for_estimator = ansatz_t + ansatz_s
-    all_observables_for_estimator = observables_t + observables_s
+    # Repeat each circuit once per observable and tile the observable list
+    # once per circuit, building the combined estimator batch directly (the
+    # tensor block followed by the superposition block) rather than
+    # concatenating two intermediate halves
+    all_ansatze_for_estimator: list[QuantumCircuit] = [
+        circuit for circuit in tensor_ansatze for _ in tensor_paulis
+    ]
+    all_ansatze_for_estimator += [
+        circuit for circuit in superposition_ansatze for _ in superposition_paulis
+    ]
+    all_observables_for_estimator: list[SparsePauliOp] = tensor_observables * len(
+        tensor_ansatze
+    )
+    all_observables_for_estimator += superposition_observables * len(
+        superposition_ansatze
+    )
 
     # ID for this job. If it is the first job for the knitter, it will become the session ID
     job_id: str | None = None
@@ -694,7 +848,7 @@ def _estimate_expvals(
             raise ValueError(
                 "If passing a QiskitRuntimeService, a list of backend names must be specified."
             )
-        service = QiskitRuntimeService(**service_args)
+        service = _get_runtime_service(service_args)
         session = Session(service=service, backend=backend_name)
         session._session_id = session_id
         estimator = Estimator(session=session, options=options)
@@ -711,11 +865,15 @@ def _estimate_expvals(
         for i in range(20):
             if job.result() is not None:
                 break
+            # Exponential backoff with jitter: transient runtime hiccups often
+            # resolve in seconds, so retry quickly at first and spread the
+            # retries of concurrent partitions apart
+            delay = min(60.0, 3.0 * 2**i) * random.uniform(0.5, 1.5)
             logger.warning(
                 f"A None result was returned from Qiskit Runtime (job id: {job.job_id}). "
-                "Waiting 3 seconds and querying again..."
+                f"Waiting {delay:.1f} seconds and querying again..."
             )
-            time.sleep(3)
+            time.sleep(delay)
         else:
             raise RuntimeError("A None result was returned from Qiskit Runtime.")
 
@@ -742,20 +900,13 @@ def _estimate_expvals(
     tensor_expval_list = list(
         estimator_results_t.reshape((len(tensor_ansatze), len(tensor_paulis)))
     )
-    superposition_expval_list = list(
-        estimator_results_s.reshape(
-            (len(superposition_ansatze), len(superposition_paulis))
-        )
+    superposition_expvals_array = estimator_results_s.reshape(
+        (len(superposition_ansatze), len(superposition_paulis))
     )
 
-    # Scale the superposition terms
-    for i, ansatz in enumerate(superposition_ansatze):
-        # Scale the expectation values to account for 1/sqrt(2) coefficients
-        if "hybrid_xmin" in ansatz.name:
-            superposition_expval_list[i] *= 0.0
-        elif "hybrid_xplus" in ansatz.name:
-            pass
-        else:
-            superposition_expval_list[i] *= 0.5
+    # Scale the superposition terms to account for the 1/sqrt(2) coefficients
+    # in one broadcast multiply across all circuits
+    superposition_expvals_array *= superposition_scales[:, None]
+    superposition_expval_list = list(superposition_expvals_array)
 
     return tensor_expval_list, superposition_expval_list, job_id
@@ -46,10 +46,12 @@ def chi2_distance(target, obs):  # noqa: D301
     obs = np.absolute(obs)
     if isinstance(target, np.ndarray):
         assert len(target) == len(obs)
-        distance = 0
-        for t, o in zip(target, obs):
-            if abs(t - o) > 1e-10:
-                distance += np.power(t - o, 2) / (t + o)
+        # One vectorized mask instead of a per-element threshold check
+        diff = target - obs
+        mask = np.abs(diff) > 1e-10
+        if not mask.any():
+            return 0
+        distance = np.sum(np.power(diff[mask], 2) / (target[mask] + obs[mask]))
     elif isinstance(target, dict):
         distance = 0
         for o_idx, o in enumerate(obs):
@@ -245,8 +247,5 @@ def HOP(target, obs):
     target = copy.deepcopy(target)
     obs = copy.deepcopy(obs)
     target_median = np.median(target)
-    hop = 0
-    for t, o in zip(target, obs):
-        if t > target_median:
-            hop += o
+    hop = np.sum(obs[target > target_median])
     return hop